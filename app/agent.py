@@ -1,10 +1,14 @@
 from __future__ import annotations
+import asyncio
+import functools
 import json
 import os
 from datetime import datetime, timezone
 from typing import Any, Optional, Dict, List
 
-from apscheduler.schedulers.background import BackgroundScheduler
+import orjson
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from app.utils.logger import logger
 
@@ -14,11 +18,12 @@ from langchain_core.tools import Tool, StructuredTool
 from langchain.agents import create_tool_calling_agent, AgentExecutor
 from pydantic import BaseModel, Field
 
-from app.utils.config import settings
-from app.tools.earthquake_tool import fetch_recent_earthquakes
+from app.utils.config import ensure_output_dirs, settings
+from app.utils.io import briefing_writer
+from app.tools.earthquake_tool import fetch_recent_earthquakes, afetch_recent_earthquakes
 from app.tools.portfolio_tool import compute_portfolio_exposure
-from app.tools.news_tool import fetch_live_news
-from app.tools.alerts_tool import fetch_active_alerts
+from app.tools.news_tool import fetch_live_news, afetch_live_news
+from app.tools.alerts_tool import fetch_active_alerts, afetch_active_alerts
 
 # Ensure OpenAI key is available and avoid base URL overrides that redirect traffic
 OPENAI_API_KEY = settings.openai_api_key or os.getenv("OPENAI_API_KEY")
@@ -30,6 +35,15 @@ for _k in ("OPENAI_BASE_URL", "OPENAI_API_BASE"):
         os.environ.pop(_k, None)
 
 
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _dump_tool_result(result: Dict[str, Any]) -> str:
+    # orjson is several times faster than json on the deeply nested GeoJSON
+    # payloads these tools return, and handles numpy scalars natively
+    return orjson.dumps(result, option=_ORJSON_OPTS).decode()
+
+
 # Structured tool schemas & functions
 class EarthquakeInput(BaseModel):
     min_magnitude: float = Field(default=4.5, description="Minimum magnitude threshold")
@@ -38,7 +52,43 @@ class EarthquakeInput(BaseModel):
 
 def earthquake_tool_run(min_magnitude: float = 4.5, window: str = "day") -> str:
     result = fetch_recent_earthquakes(min_magnitude=min_magnitude, window=window, region_bbox=None)
-    return json.dumps(result)
+    return _dump_tool_result(result)
+
+
+# Speculative USGS fetches started before the LLM emits its tool call,
+# keyed by (min_magnitude, window, region_bbox)
+_speculative_eq: Dict[tuple, "asyncio.Task[Dict[str, Any]]"] = {}
+
+
+def _speculate_earthquakes(min_magnitude: float = 4.5, window: str = "day") -> None:
+    """Kick off the USGS fetch for the plan's deterministic step-1 args."""
+    key = (min_magnitude, window, None)
+    existing = _speculative_eq.get(key)
+    if existing is None or existing.done():
+        _speculative_eq[key] = asyncio.create_task(
+            afetch_recent_earthquakes(min_magnitude=min_magnitude, window=window, region_bbox=None)
+        )
+
+
+def _discard_speculative() -> None:
+    for task in _speculative_eq.values():
+        if task.done():
+            if not task.cancelled():
+                task.exception()  # retrieve so unconsumed failures do not warn
+        else:
+            task.cancel()
+    _speculative_eq.clear()
+
+
+async def aearthquake_tool_run(min_magnitude: float = 4.5, window: str = "day") -> str:
+    # Consume a matching speculative fetch if one is in flight; fall back to a
+    # fresh fetch when the LLM overrode the default args.
+    task = _speculative_eq.pop((min_magnitude, window, None), None)
+    if task is not None and not task.cancelled():
+        result = await task
+    else:
+        result = await afetch_recent_earthquakes(min_magnitude=min_magnitude, window=window, region_bbox=None)
+    return _dump_tool_result(result)
 
 
 class PortfolioInput(BaseModel):
@@ -51,7 +101,15 @@ def portfolio_tool_run(portfolio_csv: Optional[str] = None, cone_feature: Dict[s
         raise ValueError("cone_feature missing")
     csv_path = portfolio_csv or settings.portfolio_csv
     result = compute_portfolio_exposure(csv_path, cone_feature)
-    return json.dumps(result)
+    return _dump_tool_result(result)
+
+
+async def aportfolio_tool_run(portfolio_csv: Optional[str] = None, cone_feature: Dict[str, Any] = None) -> str:  # type: ignore[assignment]
+    if cone_feature is None:
+        raise ValueError("cone_feature missing")
+    csv_path = portfolio_csv or settings.portfolio_csv
+    result = await asyncio.to_thread(compute_portfolio_exposure, csv_path, cone_feature)
+    return _dump_tool_result(result)
 
 
 class NewsInput(BaseModel):
@@ -62,7 +120,12 @@ class NewsInput(BaseModel):
 
 def news_tool_run(query_terms: List[str], region_hint: Optional[str] = None, page_size: int = 10) -> str:
     result = fetch_live_news(query_terms, region_hint, page_size)
-    return json.dumps(result)
+    return _dump_tool_result(result)
+
+
+async def anews_tool_run(query_terms: List[str], region_hint: Optional[str] = None, page_size: int = 10) -> str:
+    result = await afetch_live_news(query_terms, region_hint, page_size)
+    return _dump_tool_result(result)
 
 
 def build_agent():
@@ -75,6 +138,7 @@ def build_agent():
                 "Returns: fetched_at, source_title, source_url, feature_union, features"
             ),
             func=earthquake_tool_run,
+            coroutine=aearthquake_tool_run,
             args_schema=EarthquakeInput,
         ),
         StructuredTool.from_function(
@@ -84,6 +148,7 @@ def build_agent():
                 "Args: portfolio_csv (optional), cone_feature (required)."
             ),
             func=portfolio_tool_run,
+            coroutine=aportfolio_tool_run,
             args_schema=PortfolioInput,
         ),
         StructuredTool.from_function(
@@ -93,18 +158,22 @@ def build_agent():
                 "Args: query_terms (list), region_hint (optional), page_size (int)."
             ),
             func=news_tool_run,
+            coroutine=anews_tool_run,
             args_schema=NewsInput,
         ),
     ]
 
+    # Earthquake and news fetches are independent (news needs only the region),
+    # so the plan declares them parallel; only exposure depends on tool 1's output
     system_prompt = (
         "You are LEEA, an autonomous risk intelligence agent for insurers. "
         "Your goal is to monitor impactful earthquakes and assess exposure for the specified portfolio. "
         "ALWAYS follow this plan: \n"
-        "1) Call Earthquake_Data_Tool to get the latest hazard union for significant quakes.\n"
-        "2) Call Portfolio_Exposure_Tool with the hazard union to compute exposure.\n"
-        "3) Call Live_News_Tool with terms like earthquake, aftershock, damage, power outage, and the region.\n"
-        "4) Synthesize a concise Markdown briefing with sections: Event Status, Exposure, Intelligence, Assessment, Next Actions.\n"
+        "1) Call Earthquake_Data_Tool AND Live_News_Tool together in the SAME assistant message "
+        "(parallel tool calls) — the news query needs only the region and terms like earthquake, "
+        "aftershock, damage, power outage; it does not depend on the earthquake result.\n"
+        "2) Then call Portfolio_Exposure_Tool with the hazard union returned by Earthquake_Data_Tool.\n"
+        "3) Synthesize a concise Markdown briefing with sections: Event Status, Exposure, Intelligence, Assessment, Next Actions.\n"
         "Use numbers with appropriate units and include links to sources. Keep output under 600 words."
     )
 
@@ -127,8 +196,159 @@ def build_agent():
     return executor
 
 
-def run_cycle() -> dict[str, Any]:
-    executor = build_agent()
+@functools.lru_cache(maxsize=1)
+def _get_executor() -> AgentExecutor:
+    # Agent construction (tool wrappers, prompt compilation, LLM client) has no
+    # per-cycle inputs; build once and reuse across scheduled cycles. Settings
+    # are loaded once per process, so there is nothing to invalidate on.
+    return build_agent()
+
+
+def _alert_area() -> Optional[str]:
+    if settings.monitor_region and isinstance(settings.monitor_region, str) and len(settings.monitor_region.strip()) == 2:
+        return settings.monitor_region.strip().upper()
+    return None
+
+
+def _briefing_earthquakes(eq: Dict[str, Any], exposure: Dict[str, Any], now: str) -> str:
+    exp = exposure.get("exposure", {})
+    lines = []
+    lines.append("# LEEA Briefing (Earthquakes)")
+    lines.append("")
+    lines.append(f"Generated at: {now}")
+    lines.append("")
+    lines.append("## Event Status")
+    lines.append(f"{eq.get('source_title')} | Events: {eq.get('count', 0)}")
+    lines.append("")
+    lines.append("## Exposure")
+    lines.append(
+        f"Exposed assets: {exp.get('asset_count_exposed', 0)}/{exp.get('asset_count_total', 0)} | "
+        f"Exposed TIV: ${exp.get('total_insured_value_exposed', 0):,.0f} of ${exp.get('total_insured_value_total', 0):,.0f} "
+        f"(ratio {exp.get('exposure_ratio', 0):.2%})"
+    )
+    top = exp.get("top_exposed") or []
+    if top:
+        lines.append("")
+        lines.append("Top exposed (by TIV):")
+        for r in top[:5]:
+            lines.append(f"- {r['PropertyID']} (${r['TotalInsuredValue']:,.0f}) @ ({r['Latitude']:.3f}, {r['Longitude']:.3f})")
+    lines.append("")
+    lines.append("## Intelligence")
+    feats = eq.get("features") or []
+    for f in feats[:5]:
+        place = f.get("place") or "Unknown"
+        mag = f.get("mag")
+        url = f.get("url") or ""
+        mag_s = f"M{mag}" if mag is not None else "M?"
+        bullet = f"- [{mag_s} — {place}]({url})" if url else f"- {mag_s} — {place}"
+        lines.append(bullet)
+    lines.append("")
+    lines.append("## Next Actions")
+    lines.append("- Monitor USGS for aftershocks and updates; re-run exposure if hazard changes.")
+    lines.append("- If exposure is material, prepare notifications to stakeholders.")
+    return "\n".join(lines)
+
+
+def _briefing_alerts(alerts: Dict[str, Any], exposure: Dict[str, Any], area: Optional[str], now: str) -> str:
+    exp = exposure.get("exposure", {})
+    lines = []
+    lines.append("# LEEA Briefing (NWS Alerts)")
+    lines.append("")
+    lines.append(f"Generated at: {now}")
+    lines.append("")
+    lines.append("## Event Status")
+    lines.append(f"Active NWS alerts: {alerts.get('count', 0)} | Events: {', '.join(alerts.get('feature_union', {}).get('properties', {}).get('events', []) or [])}")
+    if area:
+        lines.append(f"Area filter: {area}")
+    lines.append("")
+    lines.append("## Exposure")
+    lines.append(
+        f"Exposed assets: {exp.get('asset_count_exposed', 0)}/{exp.get('asset_count_total', 0)} | "
+        f"Exposed TIV: ${exp.get('total_insured_value_exposed', 0):,.0f} of ${exp.get('total_insured_value_total', 0):,.0f} "
+        f"(ratio {exp.get('exposure_ratio', 0):.2%})"
+    )
+    lines.append("")
+    lines.append("## Next Actions")
+    lines.append("- Monitor NWS alerts for changes; re-run exposure if polygons update.")
+    return "\n".join(lines)
+
+
+def _briefing_news(news: Dict[str, Any], now: str) -> str:
+    lines = []
+    lines.append("# LEEA Briefing (news-only)")
+    lines.append("")
+    lines.append(f"Generated at: {now}")
+    lines.append("")
+    lines.append("## Event Status")
+    lines.append("Autonomous agent failed; showing recent coverage relevant to earthquakes.")
+    lines.append("")
+    lines.append("## Intelligence (recent coverage)")
+    if news.get("articles"):
+        for a in news["articles"][:10]:
+            title = a.get("title") or a.get("parsed", {}).get("title") or "Untitled"
+            url = a.get("url") or ""
+            source = (a.get("source") or "?")
+            pub = a.get("publishedAt") or a.get("parsed", {}).get("publish_date") or ""
+            bullet = f"- [{title}]({url}) — {source} {pub}" if url else f"- {title} — {source} {pub}"
+            lines.append(bullet)
+    else:
+        lines.append("- No articles returned from NewsAPI.")
+    lines.append("")
+    lines.append("## Next Actions")
+    lines.append("- Verify API keys and try again.")
+    return "\n".join(lines)
+
+
+async def _collect_fallback_artifacts(now: Optional[str] = None) -> tuple:
+    """Fetch the raw earthquake, alerts, and news artifacts concurrently.
+
+    Never raises: failures come back as exception instances in the tuple."""
+    area = _alert_area()
+    eq_res, alerts_res, news_res = await asyncio.gather(
+        afetch_recent_earthquakes(min_magnitude=4.5, window="day", region_bbox=None, now=now),
+        afetch_active_alerts(event=None, area=area, now=now),
+        afetch_live_news(
+            ["earthquake", "aftershock", "damage", "power outage"],
+            settings.monitor_region or None,
+            10,
+            now=now,
+        ),
+        return_exceptions=True,
+    )
+    return area, eq_res, alerts_res, news_res
+
+
+async def _compose_fallback_briefing(artifacts: tuple, now: str) -> tuple[str, str]:
+    """Build a briefing from the first hazard union that succeeded."""
+    area, eq_res, alerts_res, news_res = artifacts
+
+    # 1) Earthquake deterministic
+    if not isinstance(eq_res, BaseException):
+        union = eq_res.get("feature_union")
+        if union:
+            try:
+                exposure = await asyncio.to_thread(compute_portfolio_exposure, settings.portfolio_csv, union, now)
+                return _briefing_earthquakes(eq_res, exposure, now), "ok_eq"
+            except Exception:
+                logger.debug("Earthquake exposure computation failed; trying alerts fallback")
+
+    # 2) NWS Alerts fallback
+    if not isinstance(alerts_res, BaseException):
+        union = alerts_res.get("feature_union")
+        if union:
+            try:
+                exposure = await asyncio.to_thread(compute_portfolio_exposure, settings.portfolio_csv, union, now)
+                return _briefing_alerts(alerts_res, exposure, area, now), "ok_alerts"
+            except Exception:
+                logger.debug("Alerts exposure computation failed; trying news-only fallback")
+
+    # 3) News-only fallback
+    news = news_res if not isinstance(news_res, BaseException) else {"articles": []}
+    return _briefing_news(news, now), "ok_news"
+
+
+async def run_cycle() -> dict[str, Any]:
+    executor = _get_executor()
     input_vars = {
         "region": settings.monitor_region,
         "portfolio_csv": settings.portfolio_csv,
@@ -139,155 +359,168 @@ def run_cycle() -> dict[str, Any]:
         region=settings.monitor_region,
     )
 
+    # One timestamp per cycle; threaded into tool stamps and briefing headers
+    cycle_dt = datetime.now(timezone.utc)
+    cycle_iso = cycle_dt.isoformat()
+
+    # Step 1 of the plan has deterministic args; start its fetch before the LLM asks
+    _speculate_earthquakes(min_magnitude=4.5, window="day")
+    # Warm the deterministic fallback in the background so an LLM failure
+    # costs no additional fetch latency; results are tiny and cheap to drop
+    fallback_task = asyncio.create_task(_collect_fallback_artifacts(now=cycle_iso))
     try:
-        result = executor.invoke(input_vars)
+        result = await executor.ainvoke(input_vars)
         output_text = result.get("output") or ""
         status = "ok"
     except Exception:
         # Deterministic fallback chain: Earthquakes -> NWS Alerts -> News-only
-        logger.debug("Agent failure; attempting Earthquakes -> Alerts -> News fallback chain")
-        # 1) Earthquake deterministic
-        try:
-            eq = fetch_recent_earthquakes(min_magnitude=4.5, window="day", region_bbox=None)
-            union = eq.get("feature_union")
-            if union:
-                exposure = compute_portfolio_exposure(settings.portfolio_csv, union)
-                exp = exposure.get("exposure", {})
-                lines = []
-                lines.append("# LEEA Briefing (Earthquakes)")
-                lines.append("")
-                lines.append(f"Generated at: {datetime.now(timezone.utc).isoformat()}")
-                lines.append("")
-                lines.append("## Event Status")
-                lines.append(f"{eq.get('source_title')} | Events: {eq.get('count', 0)}")
-                lines.append("")
-                lines.append("## Exposure")
-                lines.append(
-                    f"Exposed assets: {exp.get('asset_count_exposed', 0)}/{exp.get('asset_count_total', 0)} | "
-                    f"Exposed TIV: ${exp.get('total_insured_value_exposed', 0):,.0f} of ${exp.get('total_insured_value_total', 0):,.0f} "
-                    f"(ratio {exp.get('exposure_ratio', 0):.2%})"
-                )
-                top = exp.get("top_exposed") or []
-                if top:
-                    lines.append("")
-                    lines.append("Top exposed (by TIV):")
-                    for r in top[:5]:
-                        lines.append(f"- {r['PropertyID']} (${r['TotalInsuredValue']:,.0f}) @ ({r['Latitude']:.3f}, {r['Longitude']:.3f})")
-                lines.append("")
-                lines.append("## Intelligence")
-                feats = eq.get("features") or []
-                for f in feats[:5]:
-                    p = f.get("properties", {})
-                    place = p.get("place") or "Unknown"
-                    mag = p.get("mag")
-                    time_ms = p.get("time")
-                    url = p.get("url") or ""
-                    mag_s = f"M{mag}" if mag is not None else "M?"
-                    bullet = f"- [{mag_s} — {place}]({url})" if url else f"- {mag_s} — {place}"
-                    lines.append(bullet)
-                lines.append("")
-                lines.append("## Next Actions")
-                lines.append("- Monitor USGS for aftershocks and updates; re-run exposure if hazard changes.")
-                lines.append("- If exposure is material, prepare notifications to stakeholders.")
-                output_text = "\n".join(lines)
-                status = "ok_eq"
-            else:
-                raise RuntimeError("eq_no_union")
-        except Exception:
-            # 2) NWS Alerts fallback
-            try:
-                area = None
-                if settings.monitor_region and isinstance(settings.monitor_region, str) and len(settings.monitor_region.strip()) == 2:
-                    area = settings.monitor_region.strip().upper()
-                alerts = fetch_active_alerts(event=None, area=area)
-                union = alerts.get("feature_union")
-                if union:
-                    exposure = compute_portfolio_exposure(settings.portfolio_csv, union)
-                    exp = exposure.get("exposure", {})
-                    lines = []
-                    lines.append("# LEEA Briefing (NWS Alerts)")
-                    lines.append("")
-                    lines.append(f"Generated at: {datetime.now(timezone.utc).isoformat()}")
-                    lines.append("")
-                    lines.append("## Event Status")
-                    lines.append(f"Active NWS alerts: {alerts.get('count', 0)} | Events: {', '.join(alerts.get('feature_union', {}).get('properties', {}).get('events', []) or [])}")
-                    if area:
-                        lines.append(f"Area filter: {area}")
-                    lines.append("")
-                    lines.append("## Exposure")
-                    lines.append(
-                        f"Exposed assets: {exp.get('asset_count_exposed', 0)}/{exp.get('asset_count_total', 0)} | "
-                        f"Exposed TIV: ${exp.get('total_insured_value_exposed', 0):,.0f} of ${exp.get('total_insured_value_total', 0):,.0f} "
-                        f"(ratio {exp.get('exposure_ratio', 0):.2%})"
-                    )
-                    lines.append("")
-                    lines.append("## Next Actions")
-                    lines.append("- Monitor NWS alerts for changes; re-run exposure if polygons update.")
-                    output_text = "\n".join(lines)
-                    status = "ok_alerts"
-                else:
-                    raise RuntimeError("alerts_no_geometry")
-            except Exception:
-                # 3) News-only fallback
-                try:
-                    news = fetch_live_news(query_terms=["earthquake", "aftershock", "damage", "power outage"], region_hint=(settings.monitor_region or None), page_size=10)
-                except Exception:
-                    news = {"articles": []}
-                lines = []
-                lines.append("# LEEA Briefing (news-only)")
-                lines.append("")
-                lines.append(f"Generated at: {datetime.now(timezone.utc).isoformat()}")
-                lines.append("")
-                lines.append("## Event Status")
-                lines.append("Autonomous agent failed; showing recent coverage relevant to earthquakes.")
-                lines.append("")
-                lines.append("## Intelligence (recent coverage)")
-                if news.get("articles"):
-                    for a in news["articles"][:10]:
-                        title = a.get("title") or a.get("parsed", {}).get("title") or "Untitled"
-                        url = a.get("url") or ""
-                        source = (a.get("source") or "?")
-                        pub = a.get("publishedAt") or a.get("parsed", {}).get("publish_date") or ""
-                        bullet = f"- [{title}]({url}) — {source} {pub}" if url else f"- {title} — {source} {pub}"
-                        lines.append(bullet)
-                else:
-                    lines.append("- No articles returned from NewsAPI.")
-                lines.append("")
-                lines.append("## Next Actions")
-                lines.append("- Verify API keys and try again.")
-                output_text = "\n".join(lines)
-                status = "ok_news"
+        logger.debug("Agent failure; composing briefing from prefetched fallback artifacts")
+        output_text, status = await _compose_fallback_briefing(await fallback_task, cycle_iso)
+    finally:
+        _discard_speculative()
+        if not fallback_task.done():
+            fallback_task.cancel()
 
     # Persist briefing
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    ts = cycle_dt.strftime("%Y%m%dT%H%M%SZ")
     out_dir = os.path.join(settings.output_dir, "briefings")
-    os.makedirs(out_dir, exist_ok=True)
+    ensure_output_dirs()
     out_name = f"briefing_{status}_{ts}.md"
     out_path = os.path.join(out_dir, out_name)
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(output_text)
-    logger.info("Briefing written: {p}", p=out_path)
+    briefing_writer.write(out_path, output_text.encode("utf-8"))
+    logger.info("Briefing queued for write: {p}", p=out_path)
 
     return {"output_path": out_path, "text": output_text, "status": status}
 
 
-def schedule() -> None:
-    if settings.run_once:
-        run_cycle()
-        return
+def run_cycle_sync() -> dict[str, Any]:
+    """Blocking wrapper for schedulers and CLI entry points."""
+    return asyncio.run(run_cycle())
 
-    scheduler = BackgroundScheduler()
-    scheduler.add_job(run_cycle, trigger=IntervalTrigger(minutes=settings.run_interval_minutes), id="leea-cycle", max_instances=1, coalesce=True)
+
+def _region_messages(region: str) -> List[Dict[str, str]]:
+    # Mirrors the build_agent prompt, flattened for a single-shot completion
+    return [
+        {
+            "role": "system",
+            "content": (
+                "You are LEEA, an autonomous risk intelligence agent for insurers. "
+                "Monitor impactful earthquakes for the specified region and synthesize a concise Markdown "
+                "briefing with sections: Event Status, Exposure, Intelligence, Assessment, Next Actions. "
+                "Use numbers with appropriate units and include links to sources. Keep output under 600 words."
+            ),
+        },
+        {
+            "role": "user",
+            "content": (
+                f"Initial Directive: Monitor earthquakes for impact on {region} using portfolio "
+                f"{settings.portfolio_csv}. Use min magnitude 4.5 and window 'day' unless instructed otherwise."
+            ),
+        },
+    ]
+
+
+def run_cycles_batch(regions: List[str]) -> dict[str, Any]:
+    """Run one briefing cycle per region through the OpenAI Batch API.
+
+    All regions are submitted as a single batch (one JSONL line per region),
+    amortizing per-request overhead versus N independent chat completions.
+    Responses are mapped back by custom_id and persisted like run_cycle output.
+    """
+    import io
+    import time as _time
+    from openai import OpenAI
+
+    client = OpenAI()
+    lines = []
+    for region in regions:
+        lines.append(json.dumps({
+            "custom_id": region,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": settings.openai_model,
+                "temperature": settings.openai_temperature,
+                "messages": _region_messages(region),
+            },
+        }))
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+    logger.info("Submitting batch of {n} region cycles", n=len(regions))
+    batch_file = client.files.create(file=io.BytesIO(payload), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        _time.sleep(settings.batch_poll_seconds)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+    by_region: dict[str, str] = {}
+    content = client.files.content(batch.output_file_id).text
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        rec = json.loads(line)
+        body = (rec.get("response") or {}).get("body") or {}
+        choices = body.get("choices") or []
+        if choices:
+            by_region[rec.get("custom_id")] = choices[0].get("message", {}).get("content") or ""
+
+    # Persist one briefing per region
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out_dir = os.path.join(settings.output_dir, "briefings")
+    ensure_output_dirs()
+    outputs: dict[str, Any] = {}
+    for region, text in by_region.items():
+        out_path = os.path.join(out_dir, f"briefing_ok_batch_{region}_{ts}.md")
+        briefing_writer.write(out_path, text.encode("utf-8"))
+        outputs[region] = {"output_path": out_path, "text": text, "status": "ok_batch"}
+    logger.info("Batch briefings queued for write: {n}", n=len(outputs))
+    return outputs
+
+
+async def _scheduled_job() -> None:
+    # Coalesce multi-region runs into one batch submission per interval
+    if len(settings.monitor_regions) > 1:
+        await asyncio.to_thread(run_cycles_batch, list(settings.monitor_regions))
+    else:
+        await run_cycle()
+
+
+async def _amain() -> None:
+    # One event loop shared by the scheduler and all async tool work
+    scheduler = AsyncIOScheduler()
+    scheduler.add_job(
+        _scheduled_job,
+        trigger=IntervalTrigger(minutes=settings.run_interval_minutes),
+        id="leea-cycle",
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=30,
+    )
     scheduler.start()
     logger.info("Scheduler started: every {m} minutes", m=settings.run_interval_minutes)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+def schedule() -> None:
+    if settings.run_once:
+        asyncio.run(_scheduled_job())
+        briefing_writer.flush()
+        return
 
     try:
-        import time
-        while True:
-            time.sleep(5)
+        asyncio.run(_amain())
     except KeyboardInterrupt:
         logger.info("Shutting down scheduler...")
-        scheduler.shutdown()
 
 
 if __name__ == "__main__":
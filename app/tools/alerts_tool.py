@@ -52,18 +52,40 @@ def _union_features(features: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     }
 
 
-def fetch_active_alerts(event: Optional[str] = None, area: Optional[str] = None) -> Dict[str, Any]:
+def _project_feature(f: Dict[str, Any]) -> Dict[str, Any]:
+    # Geometry is already represented by feature_union; keep only summary fields
+    p = f.get("properties") or {}
+    return {
+        "event": p.get("event"),
+        "severity": p.get("severity"),
+        "headline": p.get("headline"),
+        "areaDesc": p.get("areaDesc"),
+    }
+
+
+def fetch_active_alerts(event: Optional[str] = None, area: Optional[str] = None, now: Optional[str] = None) -> Dict[str, Any]:
     params = _build_params(event, area)
-    data = http_client.get_json(NWS_ALERTS_URL, params=params, headers={"Accept": "application/geo+json"})
+    data = http_client.get_json(NWS_ALERTS_URL, params=params, headers={"Accept": "application/geo+json"}, cache=True)
+    return _build_output(data, params, now)
+
+
+async def afetch_active_alerts(event: Optional[str] = None, area: Optional[str] = None, now: Optional[str] = None) -> Dict[str, Any]:
+    """Async variant of fetch_active_alerts using the shared httpx client."""
+    params = _build_params(event, area)
+    data = await http_client.aget_json(NWS_ALERTS_URL, params=params, headers={"Accept": "application/geo+json"}, cache=True)
+    return _build_output(data, params, now)
+
+
+def _build_output(data: Dict[str, Any], params: Dict[str, Any], now: Optional[str] = None) -> Dict[str, Any]:
     features = data.get("features") or []
     union_feature = _union_features(features) if features else None
     out: Dict[str, Any] = {
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "fetched_at": now or datetime.now(timezone.utc).isoformat(),
         "source_title": "NWS Active Alerts",
         "source_url": NWS_ALERTS_URL,
         "query": {k: v for k, v in params.items() if k in ("event", "area", "status", "limit")},
         "count": len(features),
         "feature_union": union_feature,
-        "features": features[:50],  # cap to keep payload reasonable
+        "features": [_project_feature(f) for f in features[:50]],  # cap to keep payload reasonable
     }
     return out
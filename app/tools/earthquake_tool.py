@@ -2,8 +2,9 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
-from shapely.geometry import Point, shape, mapping
-from shapely.ops import unary_union
+import numpy as np
+import shapely
+from shapely.geometry import mapping
 
 from app.utils.http import http_client
 
@@ -29,17 +30,20 @@ def _feed_for(min_magnitude: float, window: str) -> Tuple[str, str]:
     return f"{USGS_BASE}/{name}", label
 
 
-def _buffer_km_for_mag(m: float) -> float:
-    # Simple demo mapping of magnitude to buffer radius (km)
-    if m >= 7.0:
-        return 200.0
-    if m >= 6.0:
-        return 125.0
-    if m >= 5.0:
-        return 75.0
-    if m >= 4.0:
-        return 50.0
-    return 25.0
+# Simple demo mapping of magnitude to buffer radius (km): <4, 4+, 5+, 6+, 7+
+_MAG_THRESH = np.array([4.0, 5.0, 6.0, 7.0])
+_BUFFER_KM = np.array([25.0, 50.0, 75.0, 125.0, 200.0])
+
+
+def _buffer_km_for_mags(mags: np.ndarray) -> np.ndarray:
+    return _BUFFER_KM[np.searchsorted(_MAG_THRESH, mags, side="right")]
+
+
+def _project_feature(f: Dict[str, Any]) -> Dict[str, Any]:
+    # Only the fields the briefing uses; dropping geometry and the rest of the
+    # USGS properties keeps the tool payload (and LLM context) small
+    p = f.get("properties") or {}
+    return {"mag": p.get("mag"), "place": p.get("place"), "time": p.get("time"), "url": p.get("url")}
 
 
 def _filter_bbox(features: List[Dict[str, Any]], bbox: List[float]) -> List[Dict[str, Any]]:
@@ -58,14 +62,27 @@ def _filter_bbox(features: List[Dict[str, Any]], bbox: List[float]) -> List[Dict
     return out
 
 
-def fetch_recent_earthquakes(min_magnitude: float = 4.5, window: str = "day", region_bbox: Optional[List[float]] = None) -> Dict[str, Any]:
+def fetch_recent_earthquakes(min_magnitude: float = 4.5, window: str = "day", region_bbox: Optional[List[float]] = None, now: Optional[str] = None) -> Dict[str, Any]:
+    url, label = _feed_for(min_magnitude, window)
+    data = http_client.get_json(url, cache=True)
+    return _build_result(data, url, label, min_magnitude, window, region_bbox, now)
+
+
+async def afetch_recent_earthquakes(min_magnitude: float = 4.5, window: str = "day", region_bbox: Optional[List[float]] = None, now: Optional[str] = None) -> Dict[str, Any]:
+    """Async variant of fetch_recent_earthquakes using the shared httpx client."""
     url, label = _feed_for(min_magnitude, window)
-    data = http_client.get_json(url)
+    data = await http_client.aget_json(url, cache=True)
+    return _build_result(data, url, label, min_magnitude, window, region_bbox, now)
+
+
+def _build_result(data: Dict[str, Any], url: str, label: str, min_magnitude: float, window: str, region_bbox: Optional[List[float]], now: Optional[str] = None) -> Dict[str, Any]:
     feats: List[Dict[str, Any]] = data.get("features", [])
     if region_bbox and len(region_bbox) == 4:
         feats = _filter_bbox(feats, region_bbox)
 
-    buffers = []
+    lons: List[float] = []
+    lats: List[float] = []
+    mags: List[float] = []
     for f in feats:
         geom = f.get("geometry") or {}
         if geom.get("type") != "Point":
@@ -73,19 +90,21 @@ def fetch_recent_earthquakes(min_magnitude: float = 4.5, window: str = "day", re
         coords = geom.get("coordinates") or []
         if len(coords) < 2:
             continue
-        lon, lat = float(coords[0]), float(coords[1])
-        mag = 0.0
+        lons.append(float(coords[0]))
+        lats.append(float(coords[1]))
         try:
-            mag = float((f.get("properties") or {}).get("mag") or 0.0)
+            mags.append(float((f.get("properties") or {}).get("mag") or 0.0))
         except Exception:
-            mag = 0.0
-        km = _buffer_km_for_mag(mag)
-        deg = km / 111.0  # rough degrees-per-km at mid-latitudes
-        buffers.append(Point(lon, lat).buffer(deg))
+            mags.append(0.0)
 
     union_feature = None
-    if buffers:
-        merged = unary_union(buffers)
+    if lons:
+        # Vectorized buffer + union: one GEOS call over the whole geometry array
+        km = _buffer_km_for_mags(np.asarray(mags, dtype=np.float64))
+        deg = km / 111.0  # rough degrees-per-km at mid-latitudes
+        pts = shapely.points(np.asarray(lons, dtype=np.float64), np.asarray(lats, dtype=np.float64))
+        bufs = shapely.buffer(pts, deg, quad_segs=8)
+        merged = shapely.unary_union(bufs)
         union_feature = {
             "type": "Feature",
             "geometry": mapping(merged),
@@ -94,16 +113,16 @@ def fetch_recent_earthquakes(min_magnitude: float = 4.5, window: str = "day", re
                 "min_magnitude": min_magnitude,
                 "window": window,
                 "region_bbox": region_bbox,
-                "count": len(buffers),
+                "count": len(lons),
             },
         }
 
     return {
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "fetched_at": now or datetime.now(timezone.utc).isoformat(),
         "source_title": label,
         "source_url": url,
         "query": {"min_magnitude": min_magnitude, "window": window, "region_bbox": region_bbox},
         "count": len(feats),
         "feature_union": union_feature,
-        "features": feats[:200],
+        "features": [_project_feature(f) for f in feats[:200]],
     }
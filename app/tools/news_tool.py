@@ -1,5 +1,7 @@
 from __future__ import annotations
+import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 import warnings
@@ -51,19 +53,12 @@ def _summarize_article_via_newspaper(url: str, timeout: int = 15) -> dict[str, A
         return {"title": None, "authors": [], "text": None, "top_image": None, "publish_date": None}
 
 
-def fetch_live_news(query_terms: list[str], region_hint: str | None = None, page_size: int = 10) -> dict:
-    """
-    Query NewsAPI for live headlines matching query_terms and optional region hint.
-    For each result, attempt to fetch and parse article text via newspaper3k.
-    """
+def _build_query(query_terms: list[str], region_hint: str | None, page_size: int) -> tuple[str, dict]:
     if not settings.newsapi_key:
         raise RuntimeError("NEWSAPI_KEY not configured in environment")
-
     q = " ".join(query_terms)
     if region_hint:
         q = f"{q} {region_hint}"
-
-    logger.info(f"Fetching NewsAPI for q='{q}'")
     params = {
         "q": q,
         "language": "en",
@@ -71,15 +66,44 @@ def fetch_live_news(query_terms: list[str], region_hint: str | None = None, page
         "pageSize": page_size,
         "apiKey": settings.newsapi_key,
     }
+    return q, params
+
+
+def fetch_live_news(query_terms: list[str], region_hint: str | None = None, page_size: int = 10, now: str | None = None) -> dict:
+    """
+    Query NewsAPI for live headlines matching query_terms and optional region hint.
+    For each result, attempt to fetch and parse article text via newspaper3k.
+    """
+    q, params = _build_query(query_terms, region_hint, page_size)
+    logger.info(f"Fetching NewsAPI for q='{q}'")
     data = http_client.get_json(NEWSAPI_ENDPOINT, params=params)
+    return _assemble_result(q, data, now)
+
+
+async def afetch_live_news(query_terms: list[str], region_hint: str | None = None, page_size: int = 10, now: str | None = None) -> dict:
+    """Async variant of fetch_live_news; article parsing runs in a worker thread."""
+    q, params = _build_query(query_terms, region_hint, page_size)
+    logger.info(f"Fetching NewsAPI for q='{q}'")
+    data = await http_client.aget_json(NEWSAPI_ENDPOINT, params=params)
+    return await asyncio.to_thread(_assemble_result, q, data, now)
+
+
+def _assemble_result(q: str, data: dict, now: str | None = None) -> dict:
     status = data.get("status")
     if status != "ok":
         raise RuntimeError(f"NewsAPI error: {data}")
 
+    raw_articles = data.get("articles", [])
+    urls = [a.get("url") for a in raw_articles]
+    # Download+parse is I/O bound; overlap all articles instead of serializing
+    if urls:
+        with ThreadPoolExecutor(max_workers=min(len(urls), 16)) as ex:
+            parsed_list = list(ex.map(lambda u: _summarize_article_via_newspaper(u) if u else {}, urls))
+    else:
+        parsed_list = []
+
     articles = []
-    for a in data.get("articles", []):
-        url = a.get("url")
-        parsed = _summarize_article_via_newspaper(url) if url else {}
+    for a, url, parsed in zip(raw_articles, urls, parsed_list):
         articles.append(
             {
                 "source": (a.get("source") or {}).get("name"),
@@ -94,7 +118,7 @@ def fetch_live_news(query_terms: list[str], region_hint: str | None = None, page
         )
 
     return {
-        "queried_at": datetime.now(timezone.utc).isoformat(),
+        "queried_at": now or datetime.now(timezone.utc).isoformat(),
         "query": q,
         "count": len(articles),
         "articles": articles,
@@ -1,14 +1,17 @@
 from __future__ import annotations
+import io
 import json
-import os
-import tempfile
+import re
+import threading
+import time
 import zipfile
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 
-from shapely.geometry import shape, mapping, Polygon, MultiPolygon
-from shapely.ops import unary_union
-import shapely.geometry as sgeom
+import numpy as np
+import orjson
+import shapely
 import shapefile  # pyshp
 
 from app.utils.http import http_client
@@ -19,31 +22,85 @@ NHC_GIS_FEEDS = [
     "https://www.nhc.noaa.gov/gis-ep.xml",  # Eastern Pacific basin
 ]
 
+_ISO_Z = "%Y-%m-%dT%H:%M:%SZ"
+
+_POLY_TYPES = frozenset({shapefile.POLYGON, shapefile.POLYGONZ, shapefile.POLYGONM})
+
+# Rings whose shoelace area (in squared degrees) falls below this are slivers
+_AREA_EPS = 1e-12
+
+# Precompiled matchers for the feed-entry scan; case-insensitive search beats
+# per-entry .lower() allocations and chained substring tests
+_IS_CONE = re.compile(r"cone", re.I)
+_IS_GEOJSON = re.compile(r"geojson", re.I)
+_IS_SHPZIP = re.compile(r"\.zip$", re.I)
+_IS_CONEZIP_HINT = re.compile(r"cone|5day", re.I)
+
+# One process-level download buffer, reused across scheduled refetches so each
+# cycle rewrites the same allocation instead of growing a fresh BytesIO from
+# zero. Concurrent loads serialize on the lock; the scheduler never overlaps
+# cone fetches in practice.
+_ZIP_BUF = io.BytesIO()
+_ZIP_BUF_LOCK = threading.Lock()
+
+
+def _safe_get_feed(feed_url: str):
+    try:
+        return http_client.get_feed(feed_url)
+    except Exception as e:
+        logger.warning(f"Failed to fetch NHC GIS feed {feed_url}: {e}")
+        return None
+
+
+def _extract_cone_items(feed) -> List[Dict[str, str]]:
+    items: List[Dict[str, str]] = []
+    for entry in feed.entries:
+        title = entry.get("title", "")
+        if not _IS_CONE.search(title):
+            continue
+        links = entry.get("links") or []
+        for l in links:
+            href = l.get("href") if isinstance(l, dict) else None
+            if not href:
+                continue
+            if _IS_GEOJSON.search(href):
+                items.append({"title": title, "url": href, "type": "geojson"})
+            elif _IS_SHPZIP.search(href) and _IS_CONEZIP_HINT.search(href):
+                items.append({"title": title, "url": href, "type": "shpzip"})
+    return items
+
 
 def _parse_gis_feed_for_cone_links(target_name: Optional[str] = None) -> List[Dict[str, str]]:
     """Return a list of candidate cone products from NHC feeds with type in {geojson, shpzip}."""
     items: List[Dict[str, str]] = []
-    for feed_url in NHC_GIS_FEEDS:
-        try:
-            feed = http_client.get_feed(feed_url)
-        except Exception as e:
-            logger.warning(f"Failed to fetch NHC GIS feed {feed_url}: {e}")
-            continue
-        for entry in feed.entries:
-            title = str(entry.get("title", ""))
-            if "cone" not in title.lower():
+    # Both basin feeds are independent blocking HTTP calls; fetch them in
+    # parallel so wall time is the slower of the two, not their sum
+    ex = ThreadPoolExecutor(max_workers=len(NHC_GIS_FEEDS))
+    try:
+        futures = [ex.submit(_safe_get_feed, u) for u in NHC_GIS_FEEDS]
+        if target_name:
+            # Race to first match: a storm lives in exactly one basin, so a
+            # geojson hit in whichever feed lands first makes the other moot
+            token = target_name.lower().split()[0]
+            ordered = as_completed(futures)
+        else:
+            ordered = iter(futures)
+        for fut in ordered:
+            feed = fut.result()
+            if feed is None:
                 continue
-            links = entry.get("links") or []
-            for l in links:
-                href = l.get("href") if isinstance(l, dict) else None
-                if not href:
-                    continue
-                href_s = str(href)
-                lower = href_s.lower()
-                if lower.endswith(".geojson") or "geojson" in lower:
-                    items.append({"title": title, "url": href_s, "type": "geojson"})
-                elif lower.endswith(".zip") and ("cone" in lower or "5day" in lower):
-                    items.append({"title": title, "url": href_s, "type": "shpzip"})
+            new_items = _extract_cone_items(feed)
+            if target_name:
+                match = next(
+                    (it for it in new_items if it["type"] == "geojson" and token in it["title"].lower()),
+                    None,
+                )
+                if match:
+                    logger.debug(f"NHC cone target match: {match['url']}")
+                    return [match]
+            items.extend(new_items)
+    finally:
+        ex.shutdown(wait=False)
     logger.debug(f"NHC cone candidates found: {len(items)}")
     return items
 
@@ -52,53 +109,115 @@ def _load_cone_geojson(url: str) -> Dict[str, Any]:
     logger.info(f"Loading cone GeoJSON: {url}")
     data = http_client.get_json(url)
     features = data.get("features", [])
-    geoms = [shape(f.get("geometry")) for f in features if f.get("geometry")]
-    if not geoms:
+    # Parse all geometries in one vectorized GEOS call rather than building
+    # shapely objects one dict at a time through shape()
+    raw = np.array(
+        [json.dumps(f["geometry"]) for f in features if f.get("geometry")],
+        dtype=object,
+    )
+    if raw.size == 0:
         raise ValueError("No geometries found in cone GeoJSON")
-    union = unary_union(geoms)
-    return mapping(union)
+    geoms = shapely.from_geojson(raw)
+    union = shapely.union_all(geoms)
+    return orjson.loads(shapely.to_geojson(union))
 
 
 def _load_cone_shapefile_zip(url: str) -> Dict[str, Any]:
     """Download shapefile ZIP and union all polygon features using pure Python (pyshp + shapely)."""
     logger.info(f"Loading cone shapefile ZIP: {url}")
-    resp = http_client.session.get(url, timeout=60)
-    resp.raise_for_status()
-
-    with tempfile.TemporaryDirectory() as td:
-        zip_path = os.path.join(td, "cone.zip")
-        with open(zip_path, "wb") as f:
-            f.write(resp.content)
-        with zipfile.ZipFile(zip_path) as z:
-            z.extractall(td)
-        # Find the .shp file
-        shp_files = [p for p in os.listdir(td) if p.lower().endswith(".shp")]
-        if not shp_files:
-            raise ValueError("No .shp file found in ZIP")
-        shp_path = os.path.join(td, shp_files[0])
-        r = shapefile.Reader(shp_path)
-        geoms: List[Polygon | MultiPolygon] = []
-        for s in r.shapes():
-            # Convert pyshp geometry to shapely
-            if s.shapeType not in (shapefile.POLYGON, shapefile.POLYGONZ, shapefile.POLYGONM):
+
+    # Stream the download into the shared in-memory buffer and read the
+    # shapefile members straight out of the archive; no tempdir round-trips
+    # and no per-call buffer growth
+    with _ZIP_BUF_LOCK:
+        buf = _ZIP_BUF
+        buf.seek(0)
+        with http_client.session.get(url, timeout=60, stream=True) as resp:
+            resp.raise_for_status()
+            # iter_content applies Content-Encoding decoding (resp.raw does
+            # not), so a gzip-compressed response still yields a valid archive
+            for chunk in resp.iter_content(chunk_size=1024 * 1024):
+                buf.write(chunk)
+        buf.truncate()  # clip any leftover tail from a larger previous download
+        buf.seek(0)
+
+        with zipfile.ZipFile(buf) as z:
+            shp_name = next(
+                (n for n in z.namelist() if n.lower().endswith(".shp") and not n.startswith("__MACOSX")),
+                None,
+            )
+            if not shp_name:
+                raise ValueError("No .shp file found in ZIP")
+            stem = shp_name[:-4]
+
+            def _member(ext: str) -> Optional[io.BytesIO]:
+                # pyshp needs seekable file-likes; sidecars may be absent
+                try:
+                    return io.BytesIO(z.read(stem + ext))
+                except KeyError:
+                    return None
+
+            r = shapefile.Reader(shp=io.BytesIO(z.read(shp_name)), shx=_member(".shx"), dbf=_member(".dbf"))
+
+    # Accumulate every ring into flat coordinate/index arrays so geometry
+    # construction happens in bulk GEOS calls instead of one Polygon at a time.
+    # Ring 0 of each shape is the shell; any following rings are holes.
+    rings_list: List[np.ndarray] = []
+    ring_poly: List[int] = []  # polygon id per ring
+    poly_id = -1
+    # iterShapes decodes lazily through pyshp's batch-unpack fast path, keeping
+    # memory flat instead of materializing every shape up front
+    for s in r.iterShapes():
+        if s.shapeType not in _POLY_TYPES:
+            continue
+        pts = np.asarray(s.points, dtype=np.float64)
+        parts = s.parts
+        n = len(parts)
+        first_ring = True
+        for i in range(n):
+            a = parts[i]
+            b = parts[i + 1] if i + 1 < n else len(pts)
+            ring = pts[a:b]
+            if len(ring) < 3:
                 continue
-            parts = list(s.parts) + [len(s.points)]
-            rings = []
-            for i in range(len(parts) - 1):
-                ring = s.points[parts[i]:parts[i+1]]
-                if len(ring) >= 3:
-                    rings.append(ring)
-            if not rings:
+            # Shoelace signed area drops zero-area slivers before any GEOS
+            # work; degenerate rings would otherwise pay full construction
+            x = ring[:, 0]
+            y = ring[:, 1]
+            area = 0.5 * (np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+            if abs(area) < _AREA_EPS:
                 continue
-            exterior = rings[0]
-            interiors = rings[1:] if len(rings) > 1 else []
-            poly = sgeom.Polygon(exterior, interiors)
-            if not poly.is_empty:
-                geoms.append(poly)
-        if not geoms:
-            raise ValueError("No polygon geometries in shapefile")
-        union = unary_union(geoms)
-        return mapping(union)
+            if first_ring:
+                poly_id += 1
+                first_ring = False
+            rings_list.append(ring)
+            ring_poly.append(poly_id)
+    if not rings_list:
+        raise ValueError("No polygon geometries in shapefile")
+    lengths = np.fromiter((len(rg) for rg in rings_list), dtype=np.int64, count=len(rings_list))
+    rings = shapely.linearrings(
+        np.concatenate(rings_list), indices=np.repeat(np.arange(len(rings_list)), lengths)
+    )
+    polys = shapely.polygons(rings, indices=np.asarray(ring_poly))
+    union = shapely.union_all(polys)
+    # to_geojson serializes in C; mapping() would walk the geometry building
+    # nested Python tuples, the priciest step here after the union itself
+    return orjson.loads(shapely.to_geojson(union))
+
+
+def _etag_of(url: str) -> Optional[str]:
+    """Cheap HEAD probe for the product's ETag; None when unavailable."""
+    try:
+        resp = http_client.session.head(url, timeout=http_client.timeout, allow_redirects=True)
+        return resp.headers.get("ETag")
+    except Exception as e:
+        logger.debug(f"HEAD for ETag failed {url}: {e}")
+        return None
+
+
+@lru_cache(maxsize=32)
+def _cached_cone(url: str, etag: str, kind: str) -> Dict[str, Any]:
+    return _load_cone_geojson(url) if kind == "geojson" else _load_cone_shapefile_zip(url)
 
 
 def fetch_current_cone(target_name: Optional[str] = None) -> dict:
@@ -121,7 +240,13 @@ def fetch_current_cone(target_name: Optional[str] = None) -> dict:
         geo = [it for it in items if it["type"] == "geojson"]
         chosen = geo[0] if geo else items[0]
 
-    if chosen["type"] == "geojson":
+    # NHC products change roughly every 6 hours; when the server exposes an
+    # ETag, an unchanged product skips the download + parse + union entirely.
+    # Without an ETag we cannot tell staleness apart, so bypass the cache.
+    etag = _etag_of(chosen["url"])
+    if etag:
+        geom = _cached_cone(chosen["url"], etag, chosen["type"])
+    elif chosen["type"] == "geojson":
         geom = _load_cone_geojson(chosen["url"])
     else:
         geom = _load_cone_shapefile_zip(chosen["url"])
@@ -136,7 +261,7 @@ def fetch_current_cone(target_name: Optional[str] = None) -> dict:
     }
 
     return {
-        "fetched_at": datetime.utcnow().isoformat() + "Z",
+        "fetched_at": time.strftime(_ISO_Z, time.gmtime()),
         "source_title": chosen["title"],
         "source_url": chosen["url"],
         "feature": feature,
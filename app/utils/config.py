@@ -11,6 +11,10 @@ class Settings:
     # General
     monitor_target_name: str = os.getenv("MONITOR_TARGET_NAME", "Hurricane Alex")
     monitor_region: str = os.getenv("MONITOR_REGION", "Florida")
+    # Optional comma-separated list; when set, scheduled cycles are batched across regions
+    monitor_regions: tuple[str, ...] = tuple(
+        r.strip() for r in os.getenv("MONITOR_REGIONS", "").split(",") if r.strip()
+    )
     portfolio_csv: str = os.getenv("PORTFOLIO_CSV", "data/portfolio_alpha.csv")
     output_dir: str = os.getenv("OUTPUT_DIR", "output")
 
@@ -25,15 +29,29 @@ class Settings:
     # Scheduler
     run_interval_minutes: int = int(os.getenv("RUN_INTERVAL_MINUTES", "60"))
     run_once: bool = os.getenv("RUN_ONCE", "0") == "1"
+    batch_poll_seconds: int = int(os.getenv("BATCH_POLL_SECONDS", "30"))
 
     # Networking
     http_timeout: int = int(os.getenv("HTTP_TIMEOUT", "20"))
     http_retries: int = int(os.getenv("HTTP_RETRIES", "3"))
+    http_cache_ttl: int = int(os.getenv("HTTP_CACHE_TTL", "60"))
 
 
 settings = Settings()
 
-# Ensure output subdirectories exist
-os.makedirs(settings.output_dir, exist_ok=True)
-os.makedirs(os.path.join(settings.output_dir, "briefings"), exist_ok=True)
-os.makedirs(os.path.join(settings.output_dir, "logs"), exist_ok=True)
+
+def ensure_output_dirs() -> None:
+    """Create the output subdirectories on first use.
+
+    Deferred from import time so processes that only read settings (tests,
+    CLI utilities, worker subprocesses) pay no mkdir syscalls; write paths
+    call this before persisting. The isdir guard keeps repeat calls to a
+    single stat each.
+    """
+    for path in (
+        settings.output_dir,
+        os.path.join(settings.output_dir, "briefings"),
+        os.path.join(settings.output_dir, "logs"),
+    ):
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
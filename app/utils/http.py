@@ -1,5 +1,10 @@
 from __future__ import annotations
+import asyncio
+import io
+import threading
 from typing import Any, Optional
+from cachetools import TTLCache
+import httpx
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -7,6 +12,25 @@ import feedparser
 from app.utils.logger import logger
 from .config import settings
 
+# Query-param names whose values must never reach the logs
+_SENSITIVE = frozenset({"apikey", "api_key", "key", "token"})
+
+
+class _LazyPreview:
+    """Defers the resp.text decode + 2000-char slice until a log sink actually
+    formats the record; at quieter log levels the body is never decoded."""
+
+    __slots__ = ("_resp",)
+
+    def __init__(self, resp: Any):
+        self._resp = resp
+
+    def __str__(self) -> str:
+        try:
+            return (self._resp.text or "")[:2000]
+        except Exception:
+            return ""
+
 
 class HttpClient:
     def __init__(self, timeout: int | None = None, retries: int | None = None):
@@ -28,48 +52,151 @@ class HttpClient:
         self.session.headers.update({
             "User-Agent": "LEEA/1.0 (+https://example.com)"
         })
+        # Async client is created lazily per event loop (see _get_async_client)
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        # Short-TTL response cache for feeds that update on a ~1-minute cadence
+        self._json_cache: TTLCache = TTLCache(maxsize=32, ttl=settings.http_cache_ttl)
+        self._json_cache_lock = threading.Lock()
+        # Conditional-GET state per feed URL: (etag, last_modified, parsed feed).
+        # On 304 the server sends no body, so we reuse the previous parse.
+        self._feed_cache: dict[str, tuple[Optional[str], Optional[str], feedparser.FeedParserDict]] = {}
+        self._feed_cache_lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[dict[str, Any]]) -> tuple:
+        return (url, frozenset((params or {}).items()))
+
+    def _cache_get(self, key: tuple) -> Any:
+        with self._json_cache_lock:
+            return self._json_cache.get(key)
+
+    def _cache_put(self, key: tuple, value: Any) -> None:
+        with self._json_cache_lock:
+            self._json_cache[key] = value
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        # Reuse one pooled client per event loop so connections persist across
+        # calls; recreate if the owning loop has changed (e.g. a new asyncio.run).
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=32),
+                timeout=self.timeout,
+                headers={"User-Agent": "LEEA/1.0 (+https://example.com)"},
+            )
+            self._async_loop = loop
+        return self._async_client
 
     def _mask_params(self, params: Optional[dict[str, Any]]) -> dict[str, Any]:
         if not params:
             return {}
-        masked = dict(params)
-        for k in list(masked.keys()):
-            if k.lower() in ("apikey", "api_key", "key", "token"):
-                masked[k] = "***"
-        return masked
+        # Most calls carry no credentials; only allocate the masked copy when
+        # a sensitive key is actually present
+        if not any(k.lower() in _SENSITIVE for k in params):
+            return params
+        return {k: ("***" if k.lower() in _SENSITIVE else v) for k, v in params.items()}
 
-    def get_json(self, url: str, params: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None) -> Any:
+    def get_json(self, url: str, params: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None, cache: bool = False) -> Any:
+        if cache:
+            key = self._cache_key(url, params)
+            cached = self._cache_get(key)
+            if cached is not None:
+                logger.debug("HTTP JSON cache hit {url}", url=url)
+                return cached
         safe_params = self._mask_params(params)
         resp = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
-        preview = resp.text[:2000] if resp and resp.text else ""
         logger.info(
             "HTTP JSON GET {url} status={status} params={params} preview={preview}",
             url=url,
             status=getattr(resp, "status_code", None),
             params=safe_params,
-            preview=preview,
+            preview=_LazyPreview(resp),
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        if cache:
+            self._cache_put(key, data)
+        return data
+
+    async def aget_json(self, url: str, params: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None, cache: bool = False) -> Any:
+        if cache:
+            key = self._cache_key(url, params)
+            cached = self._cache_get(key)
+            if cached is not None:
+                logger.debug("HTTP JSON cache hit {url}", url=url)
+                return cached
+        safe_params = self._mask_params(params)
+        resp = await self._get_async_client().get(url, params=params, headers=headers)
+        logger.info(
+            "HTTP JSON AGET {url} status={status} params={params} preview={preview}",
+            url=url,
+            status=resp.status_code,
+            params=safe_params,
+            preview=_LazyPreview(resp),
         )
         resp.raise_for_status()
-        return resp.json()
+        data = resp.json()
+        if cache:
+            self._cache_put(key, data)
+        return data
 
     def get_text(self, url: str, params: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None) -> str:
         safe_params = self._mask_params(params)
         resp = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
-        preview = resp.text[:2000] if resp and resp.text else ""
         logger.info(
             "HTTP TEXT GET {url} status={status} params={params} preview={preview}",
             url=url,
             status=getattr(resp, "status_code", None),
             params=safe_params,
-            preview=preview,
+            preview=_LazyPreview(resp),
         )
         resp.raise_for_status()
         return resp.text
 
+    def get_bytes(self, url: str, params: Optional[dict[str, Any]] = None, headers: Optional[dict[str, str]] = None) -> bytes:
+        # Raw payload fetch: no resp.text decode and no preview slice, which
+        # matters for multi-megabyte bodies like XML feeds and shapefile ZIPs
+        resp = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        logger.info(
+            "HTTP BYTES GET {url} status={status} bytes={n}",
+            url=url,
+            status=getattr(resp, "status_code", None),
+            n=len(resp.content) if resp.content is not None else 0,
+        )
+        resp.raise_for_status()
+        return resp.content
+
     def get_feed(self, url: str) -> feedparser.FeedParserDict:
         logger.info("HTTP FEED GET {url}", url=url)
-        text = self.get_text(url)
-        feed = feedparser.parse(text)
+        with self._feed_cache_lock:
+            cached = self._feed_cache.get(url)
+        headers: dict[str, str] = {}
+        if cached:
+            etag, modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if modified:
+                headers["If-Modified-Since"] = modified
+        resp = self.session.get(url, headers=headers or None, timeout=self.timeout)
+        if resp.status_code == 304 and cached:
+            logger.debug("Feed unchanged (304) {url}", url=url)
+            return cached[2]
+        resp.raise_for_status()
+        # Feed bodies go straight to feedparser as bytes; decoding to str first
+        # would pay charset detection plus a full copy for nothing. Forwarding
+        # the response headers lets feedparser take the charset from
+        # Content-Type in one pass instead of sniffing the body. We keep the
+        # fetch on our session (retries, pooled connections, conditional GET)
+        # rather than delegating it to feedparser's own URL fetcher.
+        # feedparser expects lower-cased header names in response_headers
+        feed = feedparser.parse(
+            io.BytesIO(resp.content),
+            response_headers={k.lower(): v for k, v in resp.headers.items()},
+        )
+        with self._feed_cache_lock:
+            self._feed_cache[url] = (resp.headers.get("ETag"), resp.headers.get("Last-Modified"), feed)
         logger.info("Parsed feed {url} entries={n}", url=url, n=len(feed.entries) if getattr(feed, "entries", None) is not None else 0)
         return feed
 
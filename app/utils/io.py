@@ -0,0 +1,76 @@
+from __future__ import annotations
+import atexit
+import os
+import queue
+import threading
+
+from app.utils.logger import logger
+
+
+class BatchFileWriter:
+    """Background writer that batches small file writes off the caller's thread.
+
+    Under scheduled fan-out (many regions x many cycles) briefing writes become
+    a per-cycle syscall stall; queueing them to one worker keeps disk latency
+    out of the cycle's critical path and coalesces bursts into batches. A
+    portable worker thread is used rather than an io_uring backend so the same
+    path works on macOS and older Linux kernels.
+    """
+
+    def __init__(self, max_batch: int = 32):
+        self.max_batch = max_batch
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="leea-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, path: str, data: bytes) -> None:
+        """Queue one file write; returns immediately."""
+        self._queue.put((path, data))
+
+    def flush(self) -> None:
+        """Block until everything queued so far has hit disk."""
+        self._queue.join()
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=10)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    stop = True
+                    break
+                batch.append(nxt)
+            self._write_batch(batch)
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                self._queue.task_done()  # the sentinel
+                return
+
+    def _write_batch(self, batch: list) -> None:
+        for path, data in batch:
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, data)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                logger.error("Failed writing {p}: {e}", p=path, e=e)
+
+
+briefing_writer = BatchFileWriter()
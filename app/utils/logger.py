@@ -10,16 +10,21 @@ LOG_FILE = os.path.join(LOG_DIR, "leea.log")
 # Ensure log directory exists
 os.makedirs(LOG_DIR, exist_ok=True)
 
-# Remove default logger and set up sinks
+# Remove default logger and set up sinks.
+# backtrace=False: extended frame capture/formatting is pure CPU overhead per
+# record under load; plain tracebacks are enough for this app.
+# No rotation compression: zipping a 20 MB log blocks the logging thread at
+# rollover; compress old logs offline if disk ever becomes a concern.
 logger.remove()
-logger.add(sys.stderr, level=LOG_LEVEL, enqueue=True, backtrace=True, diagnose=False)
+logger.add(sys.stderr, level=LOG_LEVEL, enqueue=True, backtrace=False, diagnose=False)
 logger.add(
     LOG_FILE,
     rotation="20 MB",
     retention="14 days",
-    compression="zip",
     level=LOG_LEVEL,
     enqueue=True,
+    backtrace=False,
+    diagnose=False,
 )
 
 __all__ = ["logger"]